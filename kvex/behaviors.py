@@ -32,7 +32,8 @@ class XThemed(kv.EventDispatcher):
             enable_theming: Enable the `on_subtheme` event.
         """
         super().__init__(*args, **kwargs)
-        self._subtheme_name = subtheme_name or kv.App.get_running_app().subtheme_name
+        app = kv.App.get_running_app()
+        self._subtheme_name = subtheme_name or app.subtheme_name
         self._subtheme = None
         # The reason for using events instead of properties is due to initialization
         # order: some use cases require that all classes in the MRO are initialized
@@ -42,7 +43,7 @@ class XThemed(kv.EventDispatcher):
         self.register_event_type("on_subtheme")
         if enable_theming:
             schedule_once(self.trigger_subtheme)
-            kv.App.get_running_app().bind(on_theme=self._refresh_subtheme)
+            app.bind(on_theme=self._refresh_subtheme)
 
     def on_subtheme(self, subtheme: SubTheme):
         """Called when the subtheme changes.
@@ -6,6 +6,7 @@ add or replace palettes.
 """
 
 from typing import NamedTuple
+from functools import cached_property, lru_cache
 import colorsys
 import json
 import random
@@ -73,8 +74,11 @@ class XColor:
         return self.from_hsv(self.h, saturation, self.v, self.a)
 
     def modified_alpha(self, alpha: float, /) -> "XColor":
-        """Identical `XColor` with different alpha."""
-        return self.from_hsv(self.h, self.s, self.v, alpha)
+        """Identical `XColor` with different alpha.
+
+        Colors are immutable, so recent results are cached and shared by all callers.
+        """
+        return _alpha_variant(type(self), self.__hsv, alpha)
 
     @classmethod
     def random(cls) -> "XColor":
@@ -146,11 +150,16 @@ class XColor:
         """The red, green, blue, and alpha components."""
         return self.__rgba
 
-    @property
+    @cached_property
     def hex(self) -> str:
         """Hex representation."""
         return "#" + "".join(hex(round(value * 256))[2:].zfill(2) for value in self.rgb)
 
+    @cached_property
+    def hex_upper(self) -> str:
+        """Hex representation in upper case."""
+        return self.hex.upper()
+
     def markup(self, s: str) -> str:
         """Wrap a string in color markup."""
         return f"[color={self.hex}]{s}[/color]"
@@ -160,6 +169,11 @@ class XColor:
         return f"<{self.__class__.__qualname__} {self.hex}>"
 
 
+@lru_cache(maxsize=256)
+def _alpha_variant(cls: type[XColor], hsv: tuple, alpha: float) -> XColor:
+    return cls.from_hsv(*hsv, alpha)
+
+
 RAINBOW = {
     "black": (0.0, 0.0, 0.0),
     "grey": (0.5, 0.5, 0.5),
@@ -1,7 +1,7 @@
 """Kvex utilities."""
 
 from typing import Optional, Any, Callable, Iterable
-from functools import partial, wraps
+from functools import partial, wraps, lru_cache
 import os
 import sys
 from . import kivy as kv
@@ -121,7 +121,8 @@ _metrics_dp = kv.metrics.dp
 _metrics_sp = kv.metrics.sp
 
 
-def _str2pixels(s) -> float:
+@lru_cache(maxsize=256)
+def _str2pixels(s: str) -> float:
     vstr = str(s)
     if vstr.endswith("dp"):
         return _metrics_dp(vstr[:-2])
@@ -130,6 +131,17 @@ def _str2pixels(s) -> float:
     raise ValueError(f"Unkown format: {s!r} (please use 'dp' or 'sp')")
 
 
+def _clear_str2pixels_cache(*args):
+    _str2pixels.cache_clear()
+
+
+# Conversions depend on the display metrics, which can change at runtime
+kv.metrics.Metrics.bind(
+    density=_clear_str2pixels_cache,
+    fontscale=_clear_str2pixels_cache,
+)
+
+
 def sp2pixels(value: float | str | Iterable[float | str]) -> float | list[float]:
     """Convert values in 'sp', 'dp', or pixels to pixels.
 
@@ -10,7 +10,7 @@ class XDropDown(XThemed, XWidget, kv.DropDown):
 
     def __init__(self, *args, **kwargs):
         """Initialize the class."""
-        kwargs = dict(subtheme_name="secondary") | kwargs
+        kwargs.setdefault("subtheme_name", "secondary")
         super().__init__(*args, **kwargs)
 
     def on_subtheme(self, subtheme):
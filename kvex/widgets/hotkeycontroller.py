@@ -31,6 +31,7 @@ KEYCODE_TEXT = {v: k for k, v in kv.Keyboard.keycodes.items()}
 HotkeyFormat = TypeVar("HotkeyFormat", bound=str)
 """A type alias for a string formatted as either: `f'{modifiers} {key}'` or `key`."""
 MODIFIER_SORT = "^!+#"
+_MODIFIER_ORDER = {mod: i for i, mod in enumerate(MODIFIER_SORT)}
 KEY2MOD = {
     "ctrl": "^",
     "alt-gr": "!",
@@ -84,17 +85,34 @@ def _to_hotkey_format(
     if len(modifiers) == 0:
         return key_name
     # Order of modifiers should be consistent
-    sorted_modifiers = sorted(modifiers, key=lambda x: MODIFIER_SORT.index(x))
+    sorted_modifiers = sorted(modifiers, key=_MODIFIER_ORDER.__getitem__)
     # Return the HotkeyFormat
     mod_str = "".join(sorted_modifiers)
     return f"{mod_str} {key_name}"
 
 
-def _fix_modifier_order(k: str) -> str:
+def _canonical_hotkey(k: str) -> HotkeyFormat:
+    """Sort the modifiers of a hotkey to match `_to_hotkey_format`.
+
+    Raises:
+        `ValueError` if the hotkey is not in `HotkeyFormat`.
+    """
     if " " not in k:
         return k
-    mods, key = k.split(" ")
-    sorted_mods = "".join(sorted(mods, key=lambda x: MODIFIER_SORT.index(x)))
+    parts = k.split(" ")
+    if len(parts) != 2 or not parts[0] or not parts[1]:
+        raise ValueError(
+            f"Expected HotkeyFormat f'{{modifiers}} {{key}}' or 'key', got: {k!r}"
+        )
+    mods, key = parts
+    unknown = set(mods) - set(MODIFIER_SORT)
+    if unknown:
+        raise ValueError(
+            f"Unknown modifiers {''.join(sorted(unknown))!r} in hotkey {k!r},"
+            f" expected HotkeyFormat modifiers from {MODIFIER_SORT!r}"
+        )
+    # Duplicates are dropped, as `_to_hotkey_format` collects modifiers in a set
+    sorted_mods = "".join(sorted(set(mods), key=_MODIFIER_ORDER.__getitem__))
     return f"{sorted_mods} {key}"
 
 
@@ -190,8 +208,13 @@ class XHotkeyController(XWidget, kv.Widget):
     ):
         """Register a control with a hotkey.
 
-        Can be used multiple times on the same control or hotkey.
+        Can be used multiple times on the same control or hotkey. The order of
+        modifiers in *hotkey* does not matter.
+
+        Raises:
+            `ValueError` if *hotkey* is not in `HotkeyFormat`.
         """
+        hotkey = _canonical_hotkey(hotkey)
         if self.log_register:
             self.logger(f"{self.name!r} registering {control=} with {hotkey=}")
         self._hotkeys[hotkey].add(control)
@@ -14,9 +14,14 @@ from .spinner import XSpinner
 
 
 HEIGHT_UNIT = "40sp"
+_PARTIAL_NUMBERS = frozenset(("", "-", ".", "-."))
 
 
-@dataclass
+def _row_height(vertical: bool) -> float:
+    return util.sp2pixels(HEIGHT_UNIT) * (1 + vertical)
+
+
+@dataclass(slots=True)
 class XInputPanelWidget:
     """Dataclass to configure a specific `XInputPanel` widget."""
 
@@ -66,36 +71,68 @@ class XInputPanel(XDBox):
         Args:
             widgets: Dictionary of names to widgets.
         """
-        kwargs = dict(padding=("10sp", 0)) | kwargs
-        self._controls = controls = XBox()
+        kwargs.setdefault("padding", ("10sp", 0))
+        self._controls = None
         super().__init__(**kwargs)
         main_box = self
-        self.widgets: dict[str, BaseInputWidget] = dict()
+        self._widgets: dict[str, BaseInputWidget] = dict()
         self._curtains: dict[str, XCurtain] = dict()
-        # Widgets
-        self._reset_btn = XButton(text=self.reset_text, on_release=self.reset_defaults)
-        self._invoke_btn = XButton(text=self.invoke_text, on_release=self._do_invoke)
+        self._values: dict[str, Any] = dict()
+        self._pending: dict[str, XInputPanelWidget] = dict()
+        self._value_getters: list[tuple[str, Callable]] = []
+        self._values_trigger = util.create_trigger(self._dispatch_values)
+        # Shared by the invoke button and every input widget
+        self._cb_invoke = self._do_invoke
+        self._reset_btn: Optional[XButton] = None
+        self._invoke_btn: Optional[XButton] = None
         # Input Widgets
+        rows = []
+        append_row = rows.append
+        make_widget = self._make_input_widget
+        classes = INPUT_WIDGET_CLASSES
+        row_heights = _row_height(False), _row_height(True)
         for name, w in widgets.items():
-            iw_cls = INPUT_WIDGET_CLASSES[w.widget]
-            input_widget = iw_cls(w, self._do_values, self._do_invoke)
-            curtain = XCurtain(content=input_widget, showing=w.showing)
-            curtain.set_size(y=input_widget.height)
-            self.widgets[name] = input_widget
+            if w.showing:
+                input_widget = make_widget(name, w)
+                curtain = XCurtain(content=input_widget)
+                value = input_widget.get_value()
+            else:
+                # Hidden widgets are built when first needed
+                self._pending[name] = w
+                curtain = XCurtain(showing=False)
+                value = classes[w.widget].default_value(w)
+            curtain.set_size(y=row_heights[w.orientation == "vertical"])
             self._curtains[name] = curtain
-            main_box.add_widget(curtain)
+            self._values[name] = value
+            append_row(curtain)
         # Controls
-        controls = XBox()
+        buttons = []
         if self.reset_text:
-            controls.add_widget(XAnchor.wrap(self._reset_btn, padding=("5dp", 0)))
+            self._reset_btn = XButton(
+                text=self.reset_text,
+                on_release=self.reset_defaults,
+            )
+            buttons.append(self._reset_btn)
         if self.invoke_text:
-            controls.add_widget(XAnchor.wrap(self._invoke_btn, padding=("5dp", 0)))
-        if len(controls.children) == 1:
-            controls.set_size(hx=1 if self.fill_button else 0.5)
-            controls = XAnchor.wrap(controls)
-        controls.set_size(y=HEIGHT_UNIT)
-        if len(controls.children) > 0:
-            main_box.add_widget(controls)
+            self._invoke_btn = XButton(
+                text=self.invoke_text,
+                on_release=self._cb_invoke,
+            )
+            buttons.append(self._invoke_btn)
+        padding = ("5dp", 0)
+        if len(buttons) == 2:
+            self._controls = controls = XBox()
+            controls.add_widgets(*(XAnchor.wrap(b, padding=padding) for b in buttons))
+        elif len(buttons) == 1:
+            self._controls = XAnchor.wrap(buttons[0], padding=padding)
+            self._controls.set_size(hx=1 if self.fill_button else 0.5)
+            controls = XAnchor.wrap(self._controls)
+        if buttons:
+            controls.set_size(y=HEIGHT_UNIT)
+            append_row(controls)
+        # Add all rows at once to resize only once
+        if rows:
+            main_box.add_widgets(*rows)
         # Bindings
         self.bind(
             reset_text=self._on_reset_text,
@@ -106,37 +143,57 @@ class XInputPanel(XDBox):
 
     def on_fill_button(self, w, fill: bool):
         """Adjust control buttons frame size hint."""
+        if self._controls is None:
+            return
         if len(self._controls.children) == 1:
             self._controls.set_size(hx=1 if fill else 0.5)
         else:
             self._controls.set_size(hx=1)
 
+    @property
+    def widgets(self) -> dict[str, "BaseInputWidget"]:
+        """Dictionary of names to input widgets.
+
+        Hidden widgets are built on first use, accessing this builds all of them.
+        """
+        for name in tuple(self._pending):
+            self._get_input_widget(name)
+        return self._widgets
+
     def get_value(self, widget_name: str, /) -> Any:
         """Get a value by name."""
-        widget = self.widgets[widget_name]
+        if widget_name in self._pending:
+            return self._values[widget_name]
+        widget = self._widgets[widget_name]
         return widget.get_value()
 
     def get_values(self) -> dict[str, Any]:
         """Get all values."""
-        return {name: iw.get_value() for name, iw in self.widgets.items()}
+        values = dict(self._values)
+        for name, get_value in self._value_getters:
+            values[name] = get_value()
+        return values
 
     def reset_defaults(self, *args, **kwargs):
         """Reset all values to their defaults."""
-        for iw in self.widgets.values():
+        # Widgets that were never built still hold their default values
+        for iw in self._widgets.values():
             iw.set_value()
 
     def set_focus(self, widget_name: str, /):
         """Focus a widget by name."""
-        widget = self.widgets[widget_name]
+        widget = self._get_input_widget(widget_name)
         widget.set_focus()
 
     def set_enabled(self, widget_name: str, set_as: bool = True, /):
         """Enable or disable a widget by name."""
-        widget = self.widgets[widget_name]
+        widget = self._get_input_widget(widget_name)
         widget.set_enabled(set_as)
 
     def set_showing(self, widget_name: str, set_as: bool = True, /):
         """Show or hide a widget by name."""
+        if set_as:
+            self._get_input_widget(widget_name)
         curtain = self._curtains[widget_name]
         curtain.showing = set_as
 
@@ -145,28 +202,51 @@ class XInputPanel(XDBox):
         pass
 
     def on_values(self, values: dict):
-        """Triggered when any of the values change."""
+        """Triggered when any of the values change, at most once per frame."""
         pass
 
+    def _make_input_widget(self, name: str, w: XInputPanelWidget) -> "BaseInputWidget":
+        iw_cls = INPUT_WIDGET_CLASSES[w.widget]
+        on_value = functools.partial(self._do_values, name)
+        input_widget = iw_cls(w, on_value, self._cb_invoke)
+        self._widgets[name] = input_widget
+        self._value_getters.append((name, input_widget.get_value))
+        return input_widget
+
+    def _get_input_widget(self, name: str) -> "BaseInputWidget":
+        w = self._pending.pop(name, None)
+        if w is not None:
+            self._curtains[name].content = self._make_input_widget(name, w)
+        return self._widgets[name]
+
     def _do_invoke(self, *args):
         self.dispatch("on_invoke", self.get_values())
 
-    def _do_values(self, *args):
-        self.dispatch("on_values", self.get_values())
+    def _do_values(self, name: str, *args):
+        # Only the widget that changed needs to be read again
+        self._values[name] = self._widgets[name].get_value()
+        self._values_trigger()
+
+    def _dispatch_values(self, *args):
+        self.dispatch("on_values", dict(self._values))
 
     def _on_reset_text(self, w, text):
-        self._reset_btn.text = text
+        if self._reset_btn is not None:
+            self._reset_btn.text = text
 
     def _on_invoke_text(self, w, text):
-        self._invoke_btn.text = text
+        if self._invoke_btn is not None:
+            self._invoke_btn.text = text
 
 
 class BaseInputWidget(XBox):
     def __init__(self, w: XInputPanelWidget, on_value: Callable, on_invoke: Callable):
         assert w.widget == self.wtype
         self.specification = w
-        super().__init__(orientation=w.orientation)
-        default_halign = "right" if w.orientation == "horizontal" else "center"
+        orientation = w.orientation
+        is_vertical = orientation == "vertical"
+        super().__init__(orientation=orientation)
+        default_halign = "center" if is_vertical else "right"
         # Build
         self.label = XLabel(
             text=w.label,
@@ -178,10 +258,10 @@ class BaseInputWidget(XBox):
         self.widget = self._get_widget(w, on_value, on_invoke)
         assert self.widget is not None
         # Assemble
-        height = util.sp2pixels(HEIGHT_UNIT) * (1 + (w.orientation == "vertical"))
-        self.set_size(y=height)
-        self.label.set_size(hx=w.label_hint if w.orientation == "horizontal" else 1)
-        self.add_widgets(self.label, self.widget)
+        self.set_size(y=_row_height(is_vertical))
+        self.label.set_size(hx=1 if is_vertical else w.label_hint)
+        self.add_widget(self.label)
+        self.add_widget(self.widget)
 
     def set_enabled(self, set_as: Optional[bool] = None, /):
         if set_as is None:
@@ -195,6 +275,7 @@ class BaseInputWidget(XBox):
 class StringInputWidget(BaseInputWidget):
     wtype = "str"
     _entry_class = XInput
+    _input_filter = None
     _text_default = ""
     _password = False
 
@@ -205,13 +286,22 @@ class StringInputWidget(BaseInputWidget):
         on_invoke: Callable,
     ):
         self._entry = self._entry_class(
-            text=str(w.default or self._text_default),
+            text=self.default_text(w),
             password=self._password,
+            input_filter=self._input_filter,
             select_on_focus=True,
         )
         self._entry.bind(text=on_value, on_text_validate=on_invoke)
         return self._entry
 
+    @classmethod
+    def default_text(cls, w: XInputPanelWidget) -> str:
+        return str(w.default or cls._text_default)
+
+    @classmethod
+    def default_value(cls, w: XInputPanelWidget) -> str:
+        return cls.default_text(w)
+
     def get_value(self) -> str:
         return self._entry.text
 
@@ -240,7 +330,7 @@ class BooleanInputWidget(BaseInputWidget):
         on_value: Callable,
         on_invoke: Callable,
     ):
-        self._checkbox = XCheckBox(active=w.default or False)
+        self._checkbox = XCheckBox(active=self.default_value(w))
         self._checkbox.bind(active=on_value)
         if w.orientation == "vertical":
             return self._checkbox
@@ -249,6 +339,10 @@ class BooleanInputWidget(BaseInputWidget):
         frame.add_widget(self._checkbox)
         return frame
 
+    @classmethod
+    def default_value(cls, w: XInputPanelWidget) -> bool:
+        return w.default or False
+
     def get_value(self) -> bool:
         return self._checkbox.active
 
@@ -267,32 +361,45 @@ class BooleanInputWidget(BaseInputWidget):
         self._checkbox.focus = True
 
 
-class IntInputWidget(StringInputWidget):
-    wtype = "int"
-    _entry_class = functools.partial(XInput, input_filter="int")
+class NumberInputWidget(StringInputWidget):
+    _parse = float
     _text_default = "0"
 
-    def get_value(self) -> int:
-        return int(self._entry.text or 0)
+    @classmethod
+    def default_value(cls, w: XInputPanelWidget) -> float:
+        return cls._parse_text(cls.default_text(w))
 
-    def set_value(self, value: Optional[int] = None, /):
+    def get_value(self) -> float:
+        return self._parse_text(self._entry.text)
+
+    @classmethod
+    def _parse_text(cls, text: str) -> float:
+        if text.isdecimal():
+            return cls._parse(text)
+        # Partial input such as "-" or "." is not a number yet
+        if text in _PARTIAL_NUMBERS:
+            return cls._parse(0)
+        try:
+            return cls._parse(text)
+        except ValueError:
+            return cls._parse(0)
+
+    def set_value(self, value: Optional[float] = None, /):
         if value is None:
             value = self.specification.default or 0
         self._entry.text = str(value)
 
 
-class FloatInputWidget(StringInputWidget):
-    wtype = "float"
-    _entry_class = functools.partial(XInput, input_filter="float")
-    _text_default = "0"
+class IntInputWidget(NumberInputWidget):
+    wtype = "int"
+    _input_filter = "int"
+    _parse = int
 
-    def get_value(self) -> float:
-        return float(self._entry.text or 0)
 
-    def set_value(self, value: Optional[float] = None, /):
-        if value is None:
-            value = self.specification.default or 0
-        self._entry.text = str(value)
+class FloatInputWidget(NumberInputWidget):
+    wtype = "float"
+    _input_filter = "float"
+    _parse = float
 
 
 class PasswordInputWidget(StringInputWidget):
@@ -310,13 +417,20 @@ class ChoiceInputWidget(BaseInputWidget):
         on_invoke: Callable,
     ):
         self._spinner = XSpinner(
-            text=w.default or "",
+            text=self.default_value(w),
             values=w.choices,
             text_autoupdate=True,
         )
         self._spinner.bind(text=on_value)
         return self._spinner
 
+    @classmethod
+    def default_value(cls, w: XInputPanelWidget) -> str:
+        # Keep the default only if it is a valid choice
+        if w.default and w.default in w.choices:
+            return w.default
+        return w.choices[0] if w.choices else ""
+
     def get_value(self) -> bool:
         return self._spinner.text
 
@@ -23,6 +23,7 @@ class XLabel(XThemed, XWidget, kv.Label):
         if fixed_width and fixed_height:
             raise RuntimeError("Must set either fixed_width or fixed_height.")
         super().__init__(**kwargs)
+        self._last_fix = None
         self._trigger_fix_height = kv.Clock.create_trigger(self._fix_height)
         self._trigger_fix_width = kv.Clock.create_trigger(self._fix_width)
         if fixed_width:
@@ -40,6 +41,10 @@ class XLabel(XThemed, XWidget, kv.Label):
 
     def _fix_height(self, *a):
         x = self.size[0]
+        # Resizing the height will trigger us again, skip if nothing changed
+        if (x, self.text) == self._last_fix:
+            return
+        self._last_fix = x, self.text
         hx = self.size_hint[0]
         self.text_size = x, None
         self.texture_update()
@@ -50,6 +55,10 @@ class XLabel(XThemed, XWidget, kv.Label):
 
     def _fix_width(self, *a):
         y = self.size[1]
+        # Resizing the width will trigger us again, skip if nothing changed
+        if (y, self.text) == self._last_fix:
+            return
+        self._last_fix = y, self.text
         hy = self.size_hint[1]
         self.text_size = None, y
         self.texture_update()
@@ -59,7 +68,8 @@ class XLabel(XThemed, XWidget, kv.Label):
             self.set_size(x=self.texture_size[0], hy=hy)
 
     def _on_size(self, *a):
-        self.text_size = self.size
+        if self.text_size != self.size:
+            self.text_size = self.size
 
     def on_subtheme(self, subtheme):
         """Apply colors."""
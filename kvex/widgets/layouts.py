@@ -15,6 +15,12 @@ class XBox(XWidget, kv.BoxLayout):
     pass
 
 
+_XZBOX_GRID_KWARGS = {
+    "horizontal": dict(orientation="rl-tb", rows=1),
+    "vertical": dict(orientation="lr-bt", cols=1),
+}
+
+
 class XZBox(XWidget, kv.GridLayout):
     """Behaves like a Box where widgets are drawn in reverse order."""
 
@@ -25,15 +31,10 @@ class XZBox(XWidget, kv.GridLayout):
         **kwargs,
     ):
         """Initialize the class."""
-        if orientation == "horizontal":
-            kwargs["orientation"] = "rl-tb"
-            kwargs["rows"] = 1
-        elif orientation == "vertical":
-            kwargs["orientation"] = "lr-bt"
-            kwargs["cols"] = 1
-        else:
+        grid_kwargs = _XZBOX_GRID_KWARGS.get(orientation)
+        if grid_kwargs is None:
             raise ValueError('orientation must be "horizontal" or "vertical"')
-        super().__init__(**kwargs)
+        super().__init__(**(kwargs | grid_kwargs))
 
     def add_widget(self, *args, **kwargs):
         """Overrides base method to insert correctly."""
@@ -47,18 +48,27 @@ class XDBox(XWidget, kv.GridLayout):
     def __init__(self, cols: int = 1, **kwargs):
         """Initialize the class."""
         super().__init__(cols=cols, **kwargs)
-        self.bind(children=self._resize)
         trigger = util.create_trigger(self._resize)
         self._snooze_trigger = lambda *a: util.snooze_trigger(trigger)
+        # Many children changing size in the same frame resize only once
+        self.bind(children=self._snooze_trigger)
 
     def add_widget(self, w, *args, **kwargs):
         """Overrides base method in order to bind to size changes."""
-        w.bind(size=self._resize)
+        w.bind(size=self._snooze_trigger)
         super().add_widget(w, *args, **kwargs)
-        self._snooze_trigger()
+
+    def remove_widget(self, w, *args, **kwargs):
+        """Overrides base method in order to unbind from size changes."""
+        w.unbind(size=self._snooze_trigger)
+        super().remove_widget(w, *args, **kwargs)
 
     def _resize(self, *a):
-        self.set_size(hx=1, y=sum([util.sp2pixels(c.height) for c in self.children]))
+        # Widget heights are numeric properties and always in pixels
+        height = sum(c.height for c in self.children)
+        if self.size_hint == [1, None] and self.height == height:
+            return
+        self.set_size(hx=1, y=height)
 
 
 class XGrid(XWidget, kv.GridLayout):
@@ -122,17 +132,34 @@ class XAnchorDelayed(XAnchor):
 
     layout_event_delay = kv.NumericProperty(0.1)
     """Delay for layout events."""
-    _delayed_layout_event = None
+    _delayed_layout_trigger = None
+
+    def __init__(self, *args, **kwargs):
+        """Initialize the class."""
+        super().__init__(*args, **kwargs)
+        self._create_delayed_layout_trigger()
+
+    def on_layout_event_delay(self, w, delay):
+        """Recreate the layout trigger with the new delay."""
+        if self._delayed_layout_trigger is not None:
+            self._create_delayed_layout_trigger()
 
     def do_layout(self, *args, **kwargs):
         """Override base method to delay layout events."""
-        if self._delayed_layout_event:
-            self._delayed_layout_event.cancel()
-        _real_do_layout = super().do_layout
-        self._delayed_layout_event = util.schedule_once(
-            lambda dt: _real_do_layout(*args, **kwargs),
+        util.snooze_trigger(self._delayed_layout_trigger)
+
+    def _create_delayed_layout_trigger(self):
+        old_trigger = self._delayed_layout_trigger
+        self._delayed_layout_trigger = util.create_trigger(
+            self._do_delayed_layout,
             self.layout_event_delay,
         )
+        if old_trigger is not None and old_trigger.is_triggered:
+            old_trigger.cancel()
+            self._delayed_layout_trigger()
+
+    def _do_delayed_layout(self, dt):
+        super().do_layout()
 
 
 class XCurtain(XAnchor):
@@ -148,25 +175,33 @@ class XCurtain(XAnchor):
     def __init__(self, *args, **kwargs):
         """Initialize the class."""
         super().__init__(*args, **kwargs)
-        self.bind(
-            content=self._on_properties,
-            showing=self._on_properties,
-            dynamic=self._on_properties,
-        )
+        # Setting several properties in the same frame refreshes only once
+        trigger = util.create_trigger(self._on_properties)
+        self.bind(content=trigger, showing=trigger, dynamic=trigger)
         self._on_properties()
 
     def _on_properties(self, *args):
-        if self.showing and self.content:
-            if self.content.parent:
-                self.clear_widgets()
-            if not self.content.parent:
-                self.add_widget(self.content)
+        content = self.content
+        if self.showing and content:
+            # Only touch the widget tree if the content is not already showing
+            if content.parent is not self:
+                if self.children:
+                    self.clear_widgets()
+                if content.parent is not None:
+                    content.parent.remove_widget(content)
+                self.add_widget(content)
             if self.dynamic:
-                self.set_size(*self.content.size)
+                self._set_dynamic_size(*content.size)
         else:
-            self.clear_widgets()
+            if self.children:
+                self.clear_widgets()
             if self.dynamic:
-                self.set_size(0, 0)
+                self._set_dynamic_size(0, 0)
+
+    def _set_dynamic_size(self, x: float, y: float):
+        if self.size_hint == [None, None] and self.size == [x, y]:
+            return
+        self.set_size(x, y)
 
     def show(self, *args, **kwargs):
         """Show the content widget."""
@@ -1,9 +1,9 @@
 """List widget."""
 
 from typing import Optional
+from collections import OrderedDict
 from .. import kivy as kv
 from ..util import text_texture, from_atlas
-from ..colors import XColor
 from ..behaviors import XThemed, XFocusBehavior
 from .layouts import XRelative
 
@@ -11,12 +11,14 @@ from .layouts import XRelative
 SELECTION_SOURCE = from_atlas("vkeyboard_background")
 SELECTION_ALPHA = 0.5, 1  # When focus is False, True respectively
 EMPTY_TEXTURE = text_texture(" ")
-
-# Cache setup
-kv.Cache.register("XList")
-cache_append = kv.Cache.append
-cache_get = kv.Cache.get
-cache_remove = kv.Cache.remove
+TEXTURE_CACHE_SIZE = 512  # Per list, least recently used are dropped first
+_STALE = object()  # Never equal to an item, forces a rect to refresh
+_ARROW_KEYS = {  # Direction and if paging
+    "up": (-1, False),
+    "down": (1, False),
+    "pageup": (-1, True),
+    "pagedown": (1, True),
+}
 
 
 class XList(XThemed, XFocusBehavior, XRelative):
@@ -60,7 +62,12 @@ class XList(XThemed, XFocusBehavior, XRelative):
         """See class documentation for details."""
         super().__init__(**kwargs)
         self._rects = []
+        self._rect_texts = []  # Item text shown by each rect, None if empty
+        self._rect_positions = ()
+        self._rect_size = 0, 0
         self._scroll = 0
+        # Textures by item text, valid for the current label kwargs
+        self._textures = OrderedDict()
         self.items = self.items or ["placeholder"]
         self._refresh_label_kwargs()
         self._create_other_graphics()
@@ -71,8 +78,8 @@ class XList(XThemed, XFocusBehavior, XRelative):
             focus=self._refresh_colors,
             items=self._on_items,
             scroll=self._on_scroll,
+            # Graphics are drawn relative to our position, so only size matters
             size=self._on_geometry,
-            pos=self._on_geometry,
             selection=self._on_selection,
             bg_color=self._refresh_colors,
             text_color=self._refresh_label_kwargs,
@@ -129,8 +136,8 @@ class XList(XThemed, XFocusBehavior, XRelative):
         if not self.collide_point(*touch.pos):
             return r
         disable_invoke = False
-        rel_pos = self.to_widget(*touch.pos)
-        idx = int((self.height - rel_pos[1]) // self.item_height)
+        # Touch is in parent coordinates, same as our pos
+        idx = int((self.top - touch.y) // self.item_height)
         if idx >= len(self.items):
             idx = len(self.items) - 1
             disable_invoke = True
@@ -145,33 +152,31 @@ class XList(XThemed, XFocusBehavior, XRelative):
         idx = self.selection
         offset = idx - self.scroll
         self._selection_rect.pos = self._get_rect_pos(offset)
-        self._selection_rect.size = self._rects[offset].size
+        self._selection_rect.size = self._rect_size
 
     def _refresh_scroll_indicator(self, *args):
         scroll = self.scroll
-        rect_count = len(self._rects)
         item_count = len(self.items)
         widget_height = self.height
         indicator_width = self.scroll_width
-        # Find relative scroll of indicator top and bottom edges
-        indicator_rel_top = 1 - scroll / item_count
-        indicator_rel_height = min(rect_count, item_count) / item_count
-        indicator_rel_bot = max(0, indicator_rel_top - indicator_rel_height)
-        # Adjust based on widget size
-        indicator_height = widget_height * indicator_rel_height
-        indicator_y = widget_height * indicator_rel_bot
         indicator_x = self.width - indicator_width
         # Sometimes we are asked to refresh when not all properties have finished
-        # updating, let's gracefully handle that by pretending we see the entire list
-        broken_geometry = (
-            (not 0 <= indicator_rel_bot <= indicator_rel_top <= 1)
-            or (not 0 <= indicator_rel_height <= 1)
+        # updating (scroll is past the items), let's gracefully handle that by
+        # pretending we see the entire list
+        if scroll > item_count:
+            self._scroll_indicator.pos = indicator_x, 0
+            self._scroll_indicator.size = indicator_width, widget_height
+            return
+        # Find relative scroll of indicator top and bottom edges, since scroll is
+        # never negative and there is at least one rect these are within [0, 1]
+        indicator_rel_top = 1 - scroll / item_count
+        indicator_rel_height = min(len(self._rects), item_count) / item_count
+        indicator_rel_bot = max(0, indicator_rel_top - indicator_rel_height)
+        self._scroll_indicator.pos = indicator_x, widget_height * indicator_rel_bot
+        self._scroll_indicator.size = (
+            indicator_width,
+            widget_height * indicator_rel_height,
         )
-        if broken_geometry:
-            indicator_height = widget_height
-            indicator_y = 0
-        self._scroll_indicator.pos = indicator_x, indicator_y
-        self._scroll_indicator.size = indicator_width, indicator_height
 
     def _on_geometry(self, *args):
         self._bg.size = self.size
@@ -194,69 +199,89 @@ class XList(XThemed, XFocusBehavior, XRelative):
         self._refresh_colors()
 
     def _refresh_colors(self, *args):
-        self._bg_color.rgba = XColor(*self.bg_color).rgba
-        self._scroll_indicator_color.rgba = XColor(*self.scroll_color).rgba
-        selection = XColor(*self.selection_color)
-        self._selection_rect_color.rgba = selection.rgba
-        self._selection_rect_color.a *= SELECTION_ALPHA[int(self.focus)]
+        # Color properties are already rgba lists
+        self._bg_color.rgba = self.bg_color
+        self._scroll_indicator_color.rgba = self.scroll_color
+        r, g, b, a = self.selection_color
+        self._selection_rect_color.rgba = r, g, b, a * SELECTION_ALPHA[int(self.focus)]
 
     def _refresh_graphics(self, *args):
-        self.canvas.clear()
         height = self.height
         item_height = self.item_height
         rect_count = max(1, int(height / item_height))
-        size = self.width, item_height
-        self._rects = []
-        append = self._rects.append
-        with self.canvas:
-            for i in range(rect_count):
-                pos = self._get_rect_pos(i)
-                rect = kv.Rectangle(size=size, pos=pos, texture=EMPTY_TEXTURE)
-                append(rect)
+        self._rect_size = size = self.width, item_height
+        self._rect_positions = tuple(
+            (0, height - item_height * (i + 1)) for i in range(rect_count)
+        )
+        if rect_count == len(self._rects):
+            # Same number of rects, move and resize them in place
+            for rect, pos in zip(self._rects, self._rect_positions):
+                rect.pos = pos
+                rect.size = size
+        else:
+            self.canvas.clear()
+            self._rects = []
+            self._rect_texts = [None] * rect_count
+            append = self._rects.append
+            with self.canvas:
+                for pos in self._rect_positions:
+                    rect = kv.Rectangle(size=size, pos=pos, texture=EMPTY_TEXTURE)
+                    append(rect)
         self._refresh_items()
         self._refresh_selection_graphics()
         self._refresh_scroll_indicator()
 
     def _get_rect_pos(self, idx: int):
+        if 0 <= idx < len(self._rect_positions):
+            return self._rect_positions[idx]
         return 0, self.height - (self.item_height * (idx + 1))
 
     def _refresh_items(self, *args):
-        items = self.items
         scroll = self.scroll
-        item_count = len(items)
+        rect_texts = self._rect_texts
+        visible = self.items[scroll : scroll + len(rect_texts)]
+        visible_count = len(visible)
+        get_texture = self._get_texture
+        # Only rects whose item changed need a new texture, e.g. when scrolling by
+        # one row or when property cascades refresh the same rows again
         for i, rect in enumerate(self._rects):
-            text = None
-            texture = EMPTY_TEXTURE
-            idx = i + scroll
-            if idx < item_count:
-                text = items[idx]
-                texture = self._get_texture(text)
-            rect.texture = texture
+            text = visible[i] if i < visible_count else None
+            if text == rect_texts[i]:
+                continue
+            rect_texts[i] = text
+            rect.texture = EMPTY_TEXTURE if text is None else get_texture(text)
 
     def _on_label_kwargs(self, w, kwargs):
-        cache_remove("XList")
+        self._textures.clear()
+        self._rect_texts = [_STALE] * len(self._rects)
         self._refresh_graphics()
 
     def _refresh_label_kwargs(self, *args):
-        self._label_kwargs = dict(
+        # Copy list properties so in-place changes are seen as a difference
+        label_kwargs = dict(
             font_name=self.font_name,
             font_size=self.font_size,
             text_size=(self.width, self.item_height),
-            padding=self.item_padding,
+            padding=tuple(self.item_padding),
             shorten=self.shorten,
             shorten_from=self.shorten_from,
-            color=self.text_color,
+            color=tuple(self.text_color),
             valign="middle",
         )
+        if label_kwargs != self._label_kwargs:
+            self._label_kwargs = label_kwargs
 
     def _get_texture(self, text: str):
-        texture_id = f"{text}{self._label_kwargs}"
-        texture = cache_get("XList", texture_id)
-        if texture is None:
-            label = kv.CoreMarkupLabel(text=text, **self._label_kwargs)
-            label.refresh()
-            texture = label.texture
-            cache_append("XList", texture_id, texture)
+        textures = self._textures
+        texture = textures.get(text)
+        if texture is not None:
+            textures.move_to_end(text)
+            return texture
+        label = kv.CoreMarkupLabel(text=text, **self._label_kwargs)
+        label.refresh()
+        texture = textures[text] = label.texture
+        if len(textures) > TEXTURE_CACHE_SIZE:
+            textures.popitem(last=False)
         return texture
 
     def _get_scroll(self):
@@ -287,7 +312,7 @@ class XList(XThemed, XFocusBehavior, XRelative):
     def keyboard_on_key_down(self, w, key_pair, text, mods):
         """Handle key presses for navigation and invocation."""
         keycode, key = key_pair
-        if key in {"up", "down", "pageup", "pagedown"}:
+        if key in _ARROW_KEYS:
             self._handle_arrow_key(key, mods)
         elif key.isnumeric():
             try:
@@ -303,23 +328,15 @@ class XList(XThemed, XFocusBehavior, XRelative):
             return super().keyboard_on_key_down(w, key_pair, text, mods)
 
     def _handle_arrow_key(self, key, mods):
-        mods = set(mods) - {"numpad"}
-        is_up = key.endswith("up")
-        is_down = key.endswith("down")
-        is_paging = key.startswith("page")
-        is_ctrl = "ctrl" in mods
-        is_shift = "shift" in mods
-        item_count = len(self.items)
-        paging_size = max(2, self.paging_size or int(len(self._rects) / 2))
-        delta = item_count if is_ctrl else paging_size if is_paging else 1
-        select = 0
-        shift = 0
-        if is_up:
-            select = -delta
-        elif is_down:
-            select = delta
-        if self.enable_shifting and is_shift:
-            shift = select
+        direction, is_paging = _ARROW_KEYS[key]
+        if "ctrl" in mods:
+            delta = len(self.items)
+        elif is_paging:
+            delta = max(2, self.paging_size or int(len(self._rects) / 2))
+        else:
+            delta = 1
+        select = direction * delta
+        shift = select if self.enable_shifting and "shift" in mods else 0
         self.shift(delta=shift)
         self.select(delta=select)
 
@@ -329,12 +346,17 @@ class XList(XThemed, XFocusBehavior, XRelative):
             return
         if index is None:
             index = self.selection
-        items = list(self.items)
-        moving = items.pop(index)
-        new_index = index + delta
-        new_index = max(0, min(new_index, len(items)))
-        items.insert(new_index, moving)
-        self.items = items
+        items = self.items
+        new_index = max(0, min(index + delta, len(items) - 1))
+        if new_index == index:
+            return
+        # Rotate only the affected slice, dispatching a single items change
+        if new_index > index:
+            moved = items[index + 1 : new_index + 1] + [items[index]]
+            items[index : new_index + 1] = moved
+        else:
+            moved = [items[index]] + items[new_index:index]
+            items[new_index : index + 1] = moved
 
 
 __all__ = (
@@ -29,8 +29,10 @@ class XScreenManager(XWidget, kv.ScreenManager):
         sm.current = "screen_name"
         ```
         """
-        old_index = self.screen_names.index(self.current)
-        new_index = self.screen_names.index(name)
+        # screen_names builds a new list on every access
+        names = self.screen_names
+        old_index = names.index(self.current)
+        new_index = names.index(name)
         return "left" if old_index < new_index else "right"
 
     @property
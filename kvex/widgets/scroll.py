@@ -1,6 +1,7 @@
 """Home of `XScroll`."""
 
 from .. import kivy as kv
+from .. import util
 from ..behaviors import XThemed
 from .widget import XWidget
 
@@ -22,14 +23,16 @@ class XScroll(XThemed, XWidget, kv.ScrollView):
             view: A widget to put in the scroll view.
             scroll_amount: Resolution of scroll in pixels.
         """
-        kwargs = dict(bar_width="5sp") | kwargs
+        kwargs.setdefault("bar_width", "5sp")
         super().__init__(**kwargs)
         self.scroll_amount = scroll_amount
         self.scroll_type = ["bars"]
         self.view = view
         self.add_widget(view)
-        self.bind(size=self._on_size, on_touch_down=self._on_touch_down)
-        self.view.bind(size=self._on_size)
+        # Our size and the view size often change together during layout
+        size_trigger = util.create_trigger(self._on_size)
+        self.bind(size=size_trigger, on_touch_down=self._on_touch_down)
+        self.view.bind(size=size_trigger)
         self._on_size()
 
     def on_subtheme(self, subtheme):
@@ -50,9 +50,10 @@ class XSliderText(XBox):
     def _set_text(self, w, value):
         if isinstance(value, float):
             value = round(value, self.rounding)
-        if value == round(value):
-            value = int(value)
-        self.label.text = str(f"{self.prefix}{value}")
+            if value.is_integer():
+                value = int(value)
+        # Label text only dispatches (and re-renders) when the shown value changes
+        self.label.text = f"{self.prefix}{value}"
 
 
 __all__ = (
@@ -1,6 +1,7 @@
 """Home of `ThemeManager` and `ThemeSelector`."""
 
 from .. import kivy as kv
+from .. import util
 from ..colors import THEME_NAMES
 from .label import XLabel
 from .layouts import XBox, XDBox, XAnchor, XFrame
@@ -8,12 +9,15 @@ from .scroll import XScroll
 from .spinner import XSpinner, XSpinnerOption
 
 
+_THEME_INDEX = {name: i for i, name in enumerate(THEME_NAMES)}
+
+
 class XThemeSelector(XSpinner):
     """A button for selecting the app's theme."""
 
     def __init__(self, **kwargs):
         """Initialize the class."""
-        kwargs = dict(option_cls=self._spinner_factory) | kwargs
+        kwargs.setdefault("option_cls", self._spinner_factory)
         super().__init__(
             text=self.app.theme_name,
             values=THEME_NAMES,
@@ -40,6 +44,7 @@ class XThemePreview(kv.FocusBehavior, XBox):
     def __init__(self):
         """Initialize the class."""
         self._palette_box = XBox()
+        self._palette_labels: list[XLabel] = []
         self._title_label = XLabel(
             font_size="24sp",
             color=(0, 0, 0),
@@ -50,14 +55,19 @@ class XThemePreview(kv.FocusBehavior, XBox):
         )
         super().__init__(orientation="vertical")
         self._make_widgets()
-        self.app.bind(on_theme=self._refresh_palette_box)
+        # Switching themes rapidly (e.g. holding an arrow key) refreshes once a frame
+        self._refresh_trigger = util.create_trigger(self._refresh_palette_box)
+        self.app.bind(on_theme=self._on_app_theme)
+
+    def _on_app_theme(self, *args):
+        self._refresh_trigger()
 
     def keyboard_on_key_down(self, w, keycode, text, modifiers):
         """Switch theme using arrow keys or [shift] tab."""
         code, key = keycode
         shifted = "shift" in modifiers
         tabbed = key == "tab"
-        cindex = THEME_NAMES.index(self.app.theme_name)
+        cindex = _THEME_INDEX[self.app.theme_name]
         if key == "right" or (tabbed and not shifted):
             cindex += 1
         elif key == "left" or (tabbed and shifted):
@@ -92,18 +102,25 @@ class XThemePreview(kv.FocusBehavior, XBox):
         )
 
     def _refresh_palette_box(self, *args):
-        self._title_label.text = self.app.theme_name.capitalize()
-        self._palette_box.clear_widgets()
-        for c in self.app.theme.palette:
+        app = self.app
+        self._title_label.text = app.theme_name.capitalize()
+        palette = app.theme.palette
+        labels = self._palette_labels
+        # Reuse existing labels, only adding or removing to match the palette size
+        while len(labels) < len(palette):
             pb = XLabel(
-                text=c.hex.upper(),
                 outline_color=(0, 0, 0),
                 outline_width=2,
                 valign="bottom",
                 enable_theming=False,
             )
-            pb.make_bg(c)
+            labels.append(pb)
             self._palette_box.add_widget(pb)
+        while len(labels) > len(palette):
+            self._palette_box.remove_widget(labels.pop())
+        for pb, c in zip(labels, palette):
+            pb.text = c.hex_upper
+            pb.make_bg(c)
 
 
 class XSubThemePreview(XFrame):
@@ -163,10 +180,10 @@ class XSubThemePreview(XFrame):
     def _get_detail_text(self, subtheme):
         bullet = subtheme.accent2.markup("•")
         fg2m = subtheme.fg2.markup
-        hexes = "\n".join((
-            f"{bullet} {color_name} color {fg2m(color.hex.upper())}"
-            for color_name, color in subtheme._asdict().items()
-        ))
+        hexes = "\n".join([
+            f"{bullet} {color_name} color {fg2m(color.hex_upper)}"
+            for color_name, color in zip(subtheme._fields, subtheme)
+        ])
         name = self.app.theme_name.capitalize()
         return f"[size=20sp][u]{name} theme[/u][/size]\n{hexes}"
 
@@ -2,13 +2,15 @@
 
 from typing import Optional
 from .. import kivy as kv
-from ..util import sp2pixels
 from ..colors import XColor
 
 
 class XWidget:
     """A mixin for kivy widgets with useful methods."""
 
+    _kvex_app = None
+    _kvex_bg = None
+
     def add_widgets(
         self,
         *children: tuple[kv.Widget, ...],
@@ -18,10 +20,17 @@ class XWidget:
         """Add multiple widgets."""
         if not children:
             raise ValueError("Must supply children to add.")
-        for child in children:
-            if insert_last:
-                kwargs["index"] = len(self.children)
-            self.add_widget(child, **kwargs)
+        add_widget = self.add_widget
+        if insert_last:
+            # Each child is inserted after the last, so the index grows by one
+            kwargs.pop("index", None)
+            index = len(self.children)
+            for child in children:
+                add_widget(child, index=index, **kwargs)
+                index += 1
+        else:
+            for child in children:
+                add_widget(child, **kwargs)
 
     def set_size(
         self,
@@ -41,12 +50,17 @@ class XWidget:
             hx: Width hint.
             hy: Height hint.
         """
-        hx = hx if x is None else None
-        hy = hy if y is None else None
-        x = self.width if x is None else x
-        y = self.height if y is None else y
-        self.size_hint = hx, hy
-        self.size = x, y
+        # Set each axis directly, leaving the size untouched where a hint is used
+        if x is None:
+            self.size_hint_x = hx
+        else:
+            self.size_hint_x = None
+            self.width = x
+        if y is None:
+            self.size_hint_y = hy
+        else:
+            self.size_hint_y = None
+            self.height = y
 
     def set_focus(self, *args):
         """Set the focus on this widget."""
@@ -54,11 +68,15 @@ class XWidget:
 
     def make_bg(self, color: Optional[XColor] = None, source: Optional[str] = None):
         """Add or update a background image using self.canvas.before."""
-        if hasattr(self, "_kvex_bg") and hasattr(self, "_kvex_bg_color"):
-            if color is not None:
+        bg = self._kvex_bg
+        if bg is not None:
+            # Skip unchanged values, any assignment would invalidate the canvas
+            if color is not None and list(color.rgba) != self._kvex_bg_color.rgba:
                 self._kvex_bg_color.rgba = color.rgba
             if source is not None:
-                self._kvex_bg.source = str(source)
+                source = str(source)
+                if source != bg.source:
+                    bg.source = source
         else:
             if color is None:
                 color = XColor(1, 1, 1, 1)
@@ -69,18 +87,24 @@ class XWidget:
                     pos=self.pos,
                     source=str(source),
                 )
-            self.bind(pos=self._update_kvex_bg_pos, size=self._update_kvex_bg_size)
+            self.fbind("pos", self._update_kvex_bg_pos)
+            self.fbind("size", self._update_kvex_bg_size)
 
     def _update_kvex_bg_pos(self, w, pos):
         self._kvex_bg.pos = pos
 
     def _update_kvex_bg_size(self, w, size):
-        self._kvex_bg.size = sp2pixels(size)
+        # Widget size is always in pixels and only dispatches when it changes
+        self._kvex_bg.size = size
 
     @property
     def app(self):
         """Get the running app."""
-        return kv.App.get_running_app()
+        # A widget only ever lives in one app, remember it once it is running
+        app = self._kvex_app
+        if app is None:
+            app = self._kvex_app = kv.App.get_running_app()
+        return app
 
 
 __all__ = (